@@ -1,20 +1,79 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import List, Optional
+from collections import defaultdict
+import asyncio
+import logging
+import logging.handlers
+import queue
 import os
 import random
 import json
+import orjson
+import msgspec
 import httpx
 import pathlib
-from openai import OpenAI
+import joblib
+import numpy as np
+import openai
+from openai import AsyncOpenAI
+from cachetools import TTLCache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI Client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Log through a queue so the stdout write (line-buffered in containers, GIL
+# held for the duration) happens on a background thread instead of blocking
+# the event loop mid-request
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+
+log = logging.getLogger("isi")
+log.setLevel(logging.INFO)
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+# Shared HTTP client for all external fetches (USGS/WSC/MSC/GBIF) and the
+# OpenAI SDK below. Reusing one pool amortizes DNS + TLS handshakes across
+# requests instead of paying them on every call; HTTP/2 lets concurrent
+# fetches share connections.
+HTTP = httpx.AsyncClient(
+    http2=True,
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+)
+
+# Initialize OpenAI Client (async so explanation calls can run concurrently).
+# It rides on the shared pool; the SDK sets its own per-request timeouts, so
+# the pool's 5s default doesn't apply to completion calls.
+client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=HTTP)
+
+# Cap concurrent OpenAI calls so a burst of /predict requests doesn't trip
+# 429s; tune OPENAI_CONCURRENCY to the account's RPM tier
+OPENAI_SEMAPHORE = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "8")))
+
+@retry(wait=wait_random_exponential(min=1, max=30), stop=stop_after_attempt(4),
+       retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
+       reraise=True)
+async def chat_completion_with_backoff(**kwargs):
+    """
+    Bounded, rate-limit-aware chat completion: the semaphore keeps burst
+    concurrency under the tier limit, and 429s/timeouts back off
+    exponentially instead of failing the region outright.
+    """
+    async with OPENAI_SEMAPHORE:
+        return await client.chat.completions.create(**kwargs)
+
+# Cache generated explanations for an hour - species/drivers/scores change
+# slowly, so most /predict requests can skip the LLM round-trip entirely
+EXPLANATION_CACHE = TTLCache(maxsize=512, ttl=3600)
 
 SPECIES_MAP = {
     "Sea Lamprey": "Petromyzon marinus",
@@ -56,12 +115,14 @@ def load_glfc_barriers():
     if path.exists():
         with open(path, "r") as f:
             return json.load(f)
-    print(f"Warning: GLFC Barriers not found at {path}")
+    log.warning(f"GLFC Barriers not found at {path}")
     return []
 
 GLFC_BARRIERS = load_glfc_barriers()
 
-app = FastAPI()
+# orjson serializes the nested coordinate arrays + long explanation strings
+# several times faster than the stdlib json path, and handles numpy floats
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Enable CORS for frontend
 origins = [
@@ -80,9 +141,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("shutdown")
+async def close_http_client():
+    await HTTP.aclose()
+
 # --- Data Models ---
+# msgspec.Struct instead of pydantic here: these are built ~6x per request and
+# re-serialized every time, and msgspec skips the per-field Python validators -
+# the win is largest on the nested coordinates arrays
 
-class RegionProperties(BaseModel):
+class RegionProperties(msgspec.Struct):
     risk_score: float
     risk_label: str
     confidence: str
@@ -91,20 +159,50 @@ class RegionProperties(BaseModel):
     explanation: str
     citations: List[dict] # Label + Link
 
-class RegionGeometry(BaseModel):
+class RegionGeometry(msgspec.Struct):
     type: str
     coordinates: List[List[List[float]]]
 
-class Region(BaseModel):
+class Region(msgspec.Struct):
     id: str
     geometry: RegionGeometry
     properties: RegionProperties
 
-class PredictionsResponse(BaseModel):
+class PredictionsResponse(msgspec.Struct):
     metadata: dict
     regions: List[Region]
     alerts: List[dict] # Dynamic feed items
 
+# Live gauge readings update every ~15 minutes upstream, so a 5-minute TTL
+# still never serves a stale 15-minute cycle twice while collapsing nearly
+# all USGS/WSC/MSC round-trips. Per-key locks single-flight concurrent
+# misses without serializing fetches for different stations.
+LIVE_DATA_CACHE = TTLCache(maxsize=64, ttl=300)
+LIVE_DATA_LOCKS = defaultdict(asyncio.Lock)
+
+async def fetch_live_cached(fetcher, *args):
+    """
+    TTL-cached wrapper for the live data fetchers (USGS/WSC/MSC).
+    Keyed on (fetcher name, args); a hit skips the network entirely.
+    """
+    key = (fetcher.__name__,) + args
+    hit = LIVE_DATA_CACHE.get(key)
+    if hit is not None:
+        return hit
+    async with LIVE_DATA_LOCKS[key]:
+        # Re-check after acquiring - another request may have filled it
+        hit = LIVE_DATA_CACHE.get(key)
+        if hit is not None:
+            return hit
+        result = await fetcher(*args)
+        # Only cache successes. The fetchers signal failure with None or an
+        # all-None tuple; caching those would pin fallback data for the full
+        # TTL, whereas skipping the store lets the next request retry.
+        failed = result is None or (isinstance(result, tuple) and all(v is None for v in result))
+        if not failed:
+            LIVE_DATA_CACHE[key] = result
+        return result
+
 # --- LIVE DATA INTEGRATION (USGS) ---
 async def fetch_usgs_data(site_id: str):
     """
@@ -113,30 +211,31 @@ async def fetch_usgs_data(site_id: str):
     """
     url = f"https://waterservices.usgs.gov/nwis/iv/?format=json&sites={site_id}&parameterCd=00060,00010&siteStatus=all"
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, timeout=5.0)
-            if resp.status_code != 200:
-                return (None, None, None)
-            
-            data = resp.json()
-            time_series = data['value']['timeSeries']
-            
-            flow = None
-            temp = None
-            
-            for ts in time_series:
-                var_code = ts['variable']['variableCode'][0]['value']
-                # Get most recent value
-                if ts['values'][0]['value']:
-                    val = float(ts['values'][0]['value'][0]['value'])
-                    if var_code == '00060': flow = val
-                    if var_code == '00010': temp = val
-            
-            citation = f"USGS National Water Information System (Site {site_id})"
-            return (flow, temp, citation)
-            
+        resp = await HTTP.get(url)
+        if resp.status_code != 200:
+            return (None, None, None)
+
+        data = orjson.loads(resp.content)
+        time_series = data['value']['timeSeries']
+
+        flow = None
+        temp = None
+
+        for ts in time_series:
+            var_code = ts['variable']['variableCode'][0]['value']
+            # Get most recent value
+            if ts['values'][0]['value']:
+                val = float(ts['values'][0]['value'][0]['value'])
+                if var_code == '00060': flow = val
+                if var_code == '00010': temp = val
+            if flow is not None and temp is not None:
+                break  # both parameters found - skip any remaining series
+
+        citation = f"USGS National Water Information System (Site {site_id})"
+        return (flow, temp, citation)
+
     except Exception as e:
-        print(f"USGS Fetch Error: {e}")
+        log.warning(f"USGS Fetch Error: {e}")
         return (None, None, None)
 
 # --- LIVE CANADIAN DATA INTEGRATION (WSC / MSC) ---
@@ -146,23 +245,22 @@ async def fetch_canadian_water_data(station_id: str):
     """
     url = f"https://api.weather.gc.ca/collections/hydrometric-realtime/items?STATION_NUMBER={station_id}&limit=1&sortby=-DATETIME"
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, timeout=5.0)
-            if resp.status_code != 200:
-                return (None, None)
-            
-            data = resp.json()
-            if not data.get('features'):
-                return (None, None)
-            
-            props = data['features'][0]['properties']
-            level = props.get('LEVEL')
-            discharge = props.get('DISCHARGE')
-            
-            citation = f"Water Survey of Canada (Station {station_id})"
-            return (discharge, level, citation)
+        resp = await HTTP.get(url)
+        if resp.status_code != 200:
+            return (None, None, None)
+
+        data = orjson.loads(resp.content)
+        if not data.get('features'):
+            return (None, None, None)
+
+        props = data['features'][0]['properties']
+        level = props.get('LEVEL')
+        discharge = props.get('DISCHARGE')
+
+        citation = f"Water Survey of Canada (Station {station_id})"
+        return (discharge, level, citation)
     except Exception as e:
-        print(f"WSC Fetch Error: {e}")
+        log.warning(f"WSC Fetch Error: {e}")
         return (None, None, None)
 
 async def fetch_canadian_climate_data(station_name: str):
@@ -171,75 +269,122 @@ async def fetch_canadian_climate_data(station_name: str):
     """
     url = f"https://api.weather.gc.ca/collections/climate-hourly/items?STATION_NAME={station_name}&limit=1&sortby=-LOCAL_DATE"
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, timeout=5.0)
-            if resp.status_code != 200:
-                return None
-            
-            data = resp.json()
-            if not data.get('features'):
-                return None
-            
-            temp = data['features'][0]['properties'].get('TEMP')
-            return temp
+        resp = await HTTP.get(url)
+        if resp.status_code != 200:
+            return None
+
+        data = orjson.loads(resp.content)
+        if not data.get('features'):
+            return None
+
+        temp = data['features'][0]['properties'].get('TEMP')
+        return temp
     except Exception as e:
-        print(f"MSC Climate Fetch Error: {e}")
+        log.warning(f"MSC Climate Fetch Error: {e}")
         return None
 
 # --- LIVE SIGHTINGS INTEGRATION (GBIF) ---
-async def fetch_gbif_sightings(species_common_name: str, coords: List[List[float]]):
+# Occurrence counts for a fixed species/bbox barely move hour to hour, so a
+# 10-minute TTL turns almost all GBIF traffic into local lookups
+GBIF_CACHE = TTLCache(maxsize=256, ttl=600)
+GBIF_LOCKS = defaultdict(asyncio.Lock)
+
+async def fetch_gbif_sightings(species_common_name: str, bbox: tuple):
     """
     Fetches recent sightings from GBIF for a given species and bounding box.
+    bbox is the pre-computed (min_lon, max_lon, min_lat, max_lat) tuple
+    cached on each region at import time.
     """
     scientific_name = SPECIES_MAP.get(species_common_name)
     if not scientific_name:
         return 0, []
 
-    # Calculate bounding box from polygon coords
-    lons = [c[0] for c in coords]
-    lats = [c[1] for c in coords]
-    min_lon, max_lon = min(lons), max(lons)
-    min_lat, max_lat = min(lats), max(lats)
+    min_lon, max_lon, min_lat, max_lat = bbox
+    cache_key = (scientific_name, round(min_lat, 2), round(max_lat, 2),
+                 round(min_lon, 2), round(max_lon, 2))
+    hit = GBIF_CACHE.get(cache_key)
+    if hit is not None:
+        return hit
 
-    # GBIF doesn't strictly need WKT for simple searches but it's cleaner
-    # We'll use the decimalLatitude/Longitude params for simplicity
-    url = "https://api.gbif.org/v1/occurrence/search"
-    params = {
-        "scientificName": scientific_name,
-        "decimalLatitude": f"{min_lat},{max_lat}",
-        "decimalLongitude": f"{min_lon},{max_lon}",
-        "hasCoordinate": "true",
-        "limit": 20
-    }
+    async with GBIF_LOCKS[cache_key]:
+        # Re-check after acquiring - another request may have filled it
+        hit = GBIF_CACHE.get(cache_key)
+        if hit is not None:
+            return hit
 
-    try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, params=params, timeout=5.0)
+        # GBIF doesn't strictly need WKT for simple searches but it's cleaner
+        # We'll use the decimalLatitude/Longitude params for simplicity
+        url = "https://api.gbif.org/v1/occurrence/search"
+        params = {
+            "scientificName": scientific_name,
+            "decimalLatitude": f"{min_lat},{max_lat}",
+            "decimalLongitude": f"{min_lon},{max_lon}",
+            "hasCoordinate": "true",
+            "limit": 20
+        }
+
+        try:
+            resp = await HTTP.get(url, params=params)
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 count = data.get("count", 0)
                 results = data.get("results", [])
+                GBIF_CACHE[cache_key] = (count, results)
                 return count, results
             return 0, []
-    except Exception as e:
-        print(f"GBIF Fetch Error: {e}")
-        return 0, []
-
-import joblib
-import pandas as pd
-import numpy as np
-import pathlib
+        except Exception as e:
+            log.warning(f"GBIF Fetch Error: {e}")
+            return 0, []
 
 # Load the trained Model (The "Quant" Brain)
 try:
     base = pathlib.Path(__file__).parent.parent
     model_path = base / "models/invasive_risk_model_v1.joblib"
     model = joblib.load(model_path)
-    print("Loaded Scikit-Learn Model.")
+    # Fan-out to joblib workers is pure overhead for a 6-row batch - force
+    # single-threaded predict (RandomForest artifacts only; the gradient
+    # boosting model has no n_jobs)
+    if hasattr(model, "n_jobs"):
+        model.n_jobs = 1
+    log.info("Loaded Scikit-Learn Model.")
 except Exception as e:
-    print(f"Warning: Model not found at {model_path if 'model_path' in locals() else 'models/'}. Using mock fallback. Error: {e}")
+    log.warning(f"Model not found at {model_path if 'model_path' in locals() else 'models/'}. Using mock fallback. Error: {e}")
     model = None
 
+# Prefer the Treelite-compiled forest when train_model.py exported one and the
+# runtime is installed - float32 thresholds in contiguous node arrays, all
+# trees in one C function, no sklearn dispatch on the hot path
+tl_predictor = None
+try:
+    import treelite_runtime
+    tl_path = pathlib.Path(__file__).parent.parent / "models/invasive_risk_model_v1.so"
+    if tl_path.exists():
+        tl_predictor = treelite_runtime.Predictor(str(tl_path))
+        log.info("Loaded Treelite compiled model.")
+except ImportError:
+    pass  # optional accelerator; sklearn path below works without it
+except Exception as e:
+    # A stale or ABI-incompatible .so must not take the server down -
+    # fall through to the sklearn model like the joblib load above
+    log.warning(f"Treelite model load failed, using sklearn predict: {e}")
+    tl_predictor = None
+
+def predict_scores(X):
+    """
+    Runs the risk model on a float32 feature matrix.
+    Uses the compiled Treelite predictor when available, else the sklearn forest.
+    """
+    if tl_predictor is not None:
+        return tl_predictor.predict(treelite_runtime.DMatrix(X))
+    return model.predict(X)
+
+@app.on_event("startup")
+async def warm_model():
+    # Pay the one-time predict costs (tree memory faulting in, backend
+    # warm-up) here so the first real /predict doesn't
+    if model is not None or tl_predictor is not None:
+        predict_scores(np.zeros((1, 5), dtype=np.float32))
+
 # --- The "Quant" Brain (Real Inference) ---
 def calculate_barrier_proximity_boost(species, coords):
     """
@@ -275,221 +420,411 @@ def calculate_barrier_proximity_boost(species, coords):
         
     return risk_boost, drivers
 
+# Define our grid cells once at import time (normally this would come from a
+# database). 5 of 6 regions never change, so rebuilding these dicts on every
+# /predict was pure allocation/GC pressure. run_inference copies the mutable
+# fields per request and patches grid-103 / *-can entries with live data.
+STATIC_REGIONS = (
+    # REGION 1: SEA LAMPREY (Legacy Threat)
+    {
+        "id": "grid-101",
+        "coords": [[[-87.5, 44.0], [-87.0, 44.0], [-87.0, 44.5], [-87.5, 44.5], [-87.5, 44.0]]],
+        "species": "Sea Lamprey",
+        "features": [1.8, 12.0, 0.8, 7.5, 0.2],
+        "drivers": ["High thermal anomaly (+1.8°C)", "Proximity to source (12km)", "High vessel traffic", "Moderate Flow"],
+        "citations": ["NOAA GLERL", "Great Lakes Commission"]
+    },
+    # REGION 2: SILVER CARP (High Priority)
+    {
+        "id": "grid-102",
+        "coords": [[[-86.5, 44.0], [-86.0, 44.0], [-86.0, 44.5], [-86.5, 44.5], [-86.5, 44.0]]],
+        "species": "Silver Carp",
+        "features": [0.2, 85.0, 0.3, 9.0, 1.2],
+        "drivers": ["Low temperature variance", "Distance from source (85km)", "Strong Currents (1.2m/s)"],
+        "citations": ["US Fish & Wildlife Service", "White House Memoranda Data"]
+    },
+    # REGION 3: BIGHEAD CARP (Live Data Focus - defaults below are the
+    # "stagnant" fallback, replaced with live USGS data per request)
+    {
+        "id": "grid-103",
+        "coords": [[[-87.5, 43.5], [-87.0, 43.5], [-87.0, 44.0], [-87.5, 44.0], [-87.5, 43.5]]],
+        "species": "Bighead Carp",
+        "features": [1.1, 5.0, 0.9, 4.2, 0.1],
+        "drivers": ["Hydrological connection", "Optimal feeding conditions"],
+        "citations": ["Historical Surveys (2023)"]
+    },
+    # REGION 4: CANADIAN BORDER (Cross-Agency Overlay)
+    {
+        "id": "grid-105-can",
+        "coords": [[[-83.1, 42.3], [-82.9, 42.3], [-82.9, 42.4], [-83.1, 42.4], [-83.1, 42.3]]], # Detroit River/Lake St Clair
+        "species": "Grass Carp",
+        "features": [0.5, 5.0, 0.9, 8.2, 0.4],
+        "drivers": ["High wetland connectivity", "Spawning habitat match"],
+        "citations": ["Fisheries and Oceans Canada (DFO)", "Invasive Species Centre (Canada)"]
+    },
+    # REGION 5: GEORGIAN BAY (Deep North Risk)
+    {
+        "id": "grid-106-can",
+        "coords": [[[-81.2, 45.1], [-80.8, 45.1], [-80.8, 45.5], [-81.2, 45.5], [-81.2, 45.1]]],
+        "species": "Sea Lamprey",
+        "features": [0.2, 5.0, 0.4, 9.5, 0.1],
+        "drivers": ["Cold water refugia", "Traditional spawning grounds"],
+        "citations": ["DFO Canada Surveillance", "Ontario Ministry of Natural Resources"]
+    },
+    # REGION 6: ST. CLAIR RIVER (Industrial Vector)
+    {
+        "id": "grid-107-can",
+        "coords": [[[-82.5, 42.9], [-82.3, 42.9], [-82.3, 43.1], [-82.5, 43.1], [-82.5, 42.9]]], # Sarnia/Port Huron
+        "species": "Silver Carp",
+        "features": [0.8, 2.0, 0.9, 8.1, 0.3],
+        "drivers": ["High ballast discharge risk", "Connecting channel bottleneck"],
+        "citations": ["Invasive Species Centre Sarnia", "WSC Station 02GG002"]
+    }
+)
+
+# Pre-compute each region's bounding box once (min_lon, max_lon, min_lat, max_lat)
+# so per-request code doesn't re-scan the polygon coords with comprehensions
+for _r in STATIC_REGIONS:
+    _poly = np.asarray(_r['coords'][0])
+    _r['bbox'] = (float(_poly[:, 0].min()), float(_poly[:, 0].max()),
+                  float(_poly[:, 1].min()), float(_poly[:, 1].max()))
+
+# Structure-of-arrays view of the grid: the immutable attributes are hoisted
+# into parallel tuples once, so the request path only copies the mutable state
+# (features/drivers/citations) and never rebuilds region dicts
+REGION_IDS = tuple(r['id'] for r in STATIC_REGIONS)
+REGION_SPECIES = tuple(r['species'] for r in STATIC_REGIONS)
+REGION_COORDS = tuple(r['coords'] for r in STATIC_REGIONS)
+REGION_BBOXES = tuple(r['bbox'] for r in STATIC_REGIONS)
+GRID103_IDX = REGION_IDS.index('grid-103')
+CANADIAN_IDXS = tuple(i for i, rid in enumerate(REGION_IDS) if rid.endswith('-can'))
+
+# Baseline feature matrix, built once - run_inference copies it and patches
+# only the rows with live data (grid-103 from USGS, Canadian rows from WSC/MSC)
+STATIC_FEATURES = np.asarray([r['features'] for r in STATIC_REGIONS], dtype=np.float32)
+
+# Polygon geometries never change either - build the structs once and share
+# them across responses instead of re-wrapping the coordinate arrays per region
+REGION_GEOMETRIES = {
+    r['id']: RegionGeometry(type="Polygon", coordinates=r['coords'])
+    for r in STATIC_REGIONS
+}
+
 async def run_inference():
-    # 1. Fetch Real-Time Data for Key Vectors
+    # 1. Fetch Real-Time Data for Key Vectors (concurrently - these are independent HTTP calls)
     # Des Plaines River at Riverside, IL (Key vector for Carp)
-    live_flow, live_temp, usgs_cite = await fetch_usgs_data("05532500")
-    
-    # Process Live Data or Fallback
+    # Little River at Windsor (WSC) + Windsor A (MSC) for the Canadian overlay
+    usgs_result, wsc_result, can_temp = await asyncio.gather(
+        fetch_live_cached(fetch_usgs_data, "05532500"),
+        fetch_live_cached(fetch_canadian_water_data, "02GH011"),
+        fetch_live_cached(fetch_canadian_climate_data, "WINDSOR A")
+    )
+    live_flow, live_temp, usgs_cite = usgs_result
+
+    # SoA working state: only the mutable per-request columns get copied;
+    # ids/species/coords/bboxes come straight from the module-level tuples
+    X = STATIC_FEATURES.copy()
+    drivers = [list(r['drivers']) for r in STATIC_REGIONS]
+    citations = [list(r['citations']) for r in STATIC_REGIONS]
+    sources = [set() for _ in STATIC_REGIONS]  # live feeds that contributed, for health board
+
+    # Process Live Data or Fallback (grid-103 is the live-USGS region)
     # Normalize cfs to approx m/s surrogate: flow / 1000
     # Normalize temp to anomaly: temp - 15.0
-    
-    grid103_features = [1.1, 5.0, 0.9, 4.2, 0.1] # Default (Stagnant)
-    grid103_drivers = ["Hydrological connection", "Optimal feeding conditions"]
-    grid103_citations = ["Historical Surveys (2023)"]
-    
     if live_flow is not None:
-        print(f"Using Live USGS Data: Flow={live_flow}cfs")
-        
+        log.info(f"Using Live USGS Data: Flow={live_flow}cfs")
+
         # Calculate derived model inputs
         flow_velocity_proxy = live_flow / 1000.0  # Rough proxy for model
         temp_anomaly = (live_temp - 10.0) if live_temp is not None else 0.0
-        
+
         # Update Features: [temp, dist, traffic, DO, flow]
-        grid103_features = [temp_anomaly, 5.0, 0.9, 8.5, flow_velocity_proxy]
-        
-        grid103_drivers = [
+        X[GRID103_IDX] = [temp_anomaly, 5.0, 0.9, 8.5, flow_velocity_proxy]
+
+        drivers[GRID103_IDX] = [
             f"Current Discharge: {live_flow} cfs (Live USGS)",
             "High connectivity"
         ]
-        if live_temp: 
-             grid103_drivers.insert(0, f"Water Temp: {live_temp}°C")
-        
-        grid103_citations.append(usgs_cite)
-    
-    
-    # Define our grid cells (normally this would come from a database)
-    regions = [
-        # REGION 1: SEA LAMPREY (Legacy Threat)
-        {
-            "id": "grid-101",
-            "coords": [[[-87.5, 44.0], [-87.0, 44.0], [-87.0, 44.5], [-87.5, 44.5], [-87.5, 44.0]]],
-            "species": "Sea Lamprey",
-            "features": [1.8, 12.0, 0.8, 7.5, 0.2], 
-            "drivers": ["High thermal anomaly (+1.8°C)", "Proximity to source (12km)", "High vessel traffic", "Moderate Flow"],
-            "citations": ["NOAA GLERL", "Great Lakes Commission"]
-        },
-        # REGION 2: SILVER CARP (High Priority)
-        {
-            "id": "grid-102", 
-            "coords": [[[-86.5, 44.0], [-86.0, 44.0], [-86.0, 44.5], [-86.5, 44.5], [-86.5, 44.0]]],
-            "species": "Silver Carp",
-            "features": [0.2, 85.0, 0.3, 9.0, 1.2], 
-            "drivers": ["Low temperature variance", "Distance from source (85km)", "Strong Currents (1.2m/s)"],
-            "citations": ["US Fish & Wildlife Service", "White House Memoranda Data"]
-        },
-        # REGION 3: BIGHEAD CARP (Live Data Focus)
-        {
-            "id": "grid-103",
-            "coords": [[[-87.5, 43.5], [-87.0, 43.5], [-87.0, 44.0], [-87.5, 44.0], [-87.5, 43.5]]],
-            "species": "Bighead Carp",
-            "features": grid103_features,
-            "drivers": grid103_drivers,
-            "citations": grid103_citations
-        },
-        # REGION 4: CANADIAN BORDER (Cross-Agency Overlay)
-        {
-            "id": "grid-105-can",
-            "coords": [[[-83.1, 42.3], [-82.9, 42.3], [-82.9, 42.4], [-83.1, 42.4], [-83.1, 42.3]]], # Detroit River/Lake St Clair
-            "species": "Grass Carp",
-            "features": [0.5, 5.0, 0.9, 8.2, 0.4],
-            "drivers": ["High wetland connectivity", "Spawning habitat match"],
-            "citations": ["Fisheries and Oceans Canada (DFO)", "Invasive Species Centre (Canada)"]
-        },
-        # REGION 5: GEORGIAN BAY (Deep North Risk)
-        {
-            "id": "grid-106-can",
-            "coords": [[[-81.2, 45.1], [-80.8, 45.1], [-80.8, 45.5], [-81.2, 45.5], [-81.2, 45.1]]], 
-            "species": "Sea Lamprey",
-            "features": [0.2, 5.0, 0.4, 9.5, 0.1],
-            "drivers": ["Cold water refugia", "Traditional spawning grounds"],
-            "citations": ["DFO Canada Surveillance", "Ontario Ministry of Natural Resources"]
-        },
-        # REGION 6: ST. CLAIR RIVER (Industrial Vector)
-        {
-            "id": "grid-107-can",
-            "coords": [[[-82.5, 42.9], [-82.3, 42.9], [-82.3, 43.1], [-82.5, 43.1], [-82.5, 42.9]]], # Sarnia/Port Huron
-            "species": "Silver Carp",
-            "features": [0.8, 2.0, 0.9, 8.1, 0.3],
-            "drivers": ["High ballast discharge risk", "Connecting channel bottleneck"],
-            "citations": ["Invasive Species Centre Sarnia", "WSC Station 02GG002"]
-        }
-    ]
+        if live_temp:
+             drivers[GRID103_IDX].insert(0, f"Water Temp: {live_temp}°C")
+
+        citations[GRID103_IDX].append(usgs_cite)
+        sources[GRID103_IDX].add("USGS")
 
     # --- Canadian Data Overlay Injection ---
-    can_discharge, can_level, can_cite = await fetch_canadian_water_data("02GH011") # Little River at Windsor
-    can_temp = await fetch_canadian_climate_data("WINDSOR A")
+    can_discharge, can_level, can_cite = wsc_result
 
-    for region in regions:
-        if region['id'].endswith('-can') and can_discharge is not None:
-            print(f"Overlays Active: Injecting Canadian WSC data into {region['id']}")
+    if can_discharge is not None:
+        for i in CANADIAN_IDXS:
+            log.info(f"Overlays Active: Injecting Canadian WSC data into {REGION_IDS[i]}")
             # Update features with live Canadian data
             temp_val = can_temp if can_temp is not None else 5.0
             # [temp_anomaly, dist, traffic, DO, flow]
-            region['features'][0] = temp_val - 10.0
-            
-            region['drivers'].insert(0, f"Live WSC Discharge: {can_discharge} m3/s")
+            X[i, 0] = temp_val - 10.0
+
+            drivers[i].insert(0, f"Live WSC Discharge: {can_discharge} m3/s")
             if can_temp is not None:
-                region['drivers'].insert(0, f"Live Ambient Temp: {can_temp}°C (MSC)")
-            
-            if can_cite not in region['citations']:
-                region['citations'].append(can_cite)
-            if can_temp is not None and "Environment and Climate Change Canada (MSC)" not in region['citations']:
-                region['citations'].append("Environment and Climate Change Canada (MSC)")
+                drivers[i].insert(0, f"Live Ambient Temp: {can_temp}°C (MSC)")
+
+            if can_cite not in citations[i]:
+                citations[i].append(can_cite)
+            sources[i].add("WSC")
+            if can_temp is not None and "Environment and Climate Change Canada (MSC)" not in citations[i]:
+                citations[i].append("Environment and Climate Change Canada (MSC)")
+            if can_temp is not None:
+                sources[i].add("MSC")
 
-    results = []
-    
     # Batch Prediction
-    if model:
-        # Extract features into a DataFrame
-        feature_data = [r['features'] for r in regions]
-        df_features = pd.DataFrame(feature_data, columns=[
-            'water_temp_anomaly', 'distance_to_source', 'vessel_traffic_density', 
-            'dissolved_oxygen', 'flow_velocity'
-        ])
-        
-        # Scikit-Learn Predict
-        predictions = model.predict(df_features)
+    if model is not None or tl_predictor is not None:
+        # Predict straight off the patched float32 matrix, in a worker thread
+        # so the CPU-bound tree walk never stalls the event loop
+        predictions = (await asyncio.to_thread(predict_scores, X)).tolist()
     else:
         # Fallback if training failed (Matching 6 regions now)
-        predictions = [0.85, 0.45, 0.92, 0.65, 0.55, 0.72] 
+        predictions = [0.85, 0.45, 0.92, 0.65, 0.55, 0.72]
 
-    for i, region in enumerate(regions):
-        # 2. Fetch Real-Time Sightings (GBIF) for EACH region
-        sighting_count, latest_sightings = await fetch_gbif_sightings(region['species'], region['coords'][0])
-        
-        # 3. Composite Inference
-        # Base score from the model (Habitat Suitability)
-        base_score = float(predictions[i])
-        
-        # Sightings Adjustment: Boost score if recent sightings exist (The "Crosswalk")
-        sighting_boost = 0.0
+    # 2. Fetch Real-Time Sightings (GBIF) for EACH region - fan out concurrently
+    # so latency is ~max(request) instead of sum(requests)
+    sightings = await asyncio.gather(
+        *(fetch_gbif_sightings(sp, bb) for sp, bb in zip(REGION_SPECIES, REGION_BBOXES)))
+
+    # 3. Composite Inference - all the score arithmetic runs as single numpy
+    # passes over the batch instead of scalar numpy ops per region
+    counts = np.array([s[0] for s in sightings])
+
+    # Sightings Adjustment: Boost score if recent sightings exist (The "Crosswalk")
+    boosts = np.where(counts > 0, np.minimum(0.3, 0.1 * np.log10(counts + 1)), 0.0)
+
+    for i in range(len(STATIC_REGIONS)):
+        sighting_count = int(counts[i])
         if sighting_count > 0:
-            sighting_boost = min(0.3, 0.1 * np.log10(sighting_count + 1))
-            region['drivers'].append(f"Confirmed sightings: {sighting_count} records (GBIF)")
-            region['citations'].append("GBIF Global Biodiversity Information Facility")
-        
+            drivers[i].append(f"Confirmed sightings: {sighting_count} records (GBIF)")
+            citations[i].append("GBIF Global Biodiversity Information Facility")
+            sources[i].add("GBIF")
+
         # Intersection Logic: If high flow (from USGS) AND recent sightings exist
         # grid-103 is the one with live USGS data
-        if region['id'] == 'grid-103' and live_flow and live_flow > 1500 and sighting_count > 0:
-            sighting_boost += 0.15
-            region['drivers'].insert(0, "CRITICAL SIGNAL: High discharge vector + nearby sighting")
-            region['citations'].append("USGS/GBIF Integrated Signal")
+        if i == GRID103_IDX and live_flow and live_flow > 1500 and sighting_count > 0:
+            boosts[i] += 0.15
+            drivers[i].insert(0, "CRITICAL SIGNAL: High discharge vector + nearby sighting")
+            citations[i].append("USGS/GBIF Integrated Signal")
 
         # 4. GLFC Barrier Integration
-        barrier_boost, barrier_drivers = calculate_barrier_proximity_boost(region['species'], region['coords'][0])
-        sighting_boost += barrier_boost
-        region['drivers'].extend(barrier_drivers)
+        barrier_boost, barrier_drivers = calculate_barrier_proximity_boost(REGION_SPECIES[i], REGION_COORDS[i][0])
+        boosts[i] += barrier_boost
+        drivers[i].extend(barrier_drivers)
         if barrier_drivers:
-            region['citations'].append("GLFC Sea Lamprey Control Map (Barriers)")
+            citations[i].append("GLFC Sea Lamprey Control Map (Barriers)")
+            sources[i].add("GLFC")
 
-        composite_score = min(0.99, base_score + sighting_boost)
-        
-        results.append({
-            "id": region['id'],
-            "coords": region['coords'],
-            "species": region['species'],
-            "score": composite_score,
-            "drivers": region['drivers'],
-            "citations": region['citations']
-        })
-        
-    return results
+    # Base model score (Habitat Suitability) + boosts, capped, in one pass
+    composite_scores = np.minimum(0.99, np.asarray(predictions) + boosts).tolist()
+
+    # Per-region dicts only materialize here, at the response-building step
+    return [
+        {
+            "id": rid,
+            "coords": coords,
+            "species": sp,
+            "score": score,
+            "drivers": drv,
+            "citations": cites,
+            "sources": src
+        }
+        for rid, coords, sp, score, drv, cites, src in zip(
+            REGION_IDS, REGION_COORDS, REGION_SPECIES, composite_scores,
+            drivers, citations, sources)
+    ]
 
 
 # --- The "Analyst" Brain (OpenAI Integration) ---
-def generate_explanation(species, score, drivers, citations):
-    try:
-        # Prompt Engineering for the "Analyst" Persona with Citations
-        citation_text = "; ".join(citations)
-        prompt = f"""
-        You are a senior environmental risk analyst. 
-        Data:
-        - Species: {species}
-        - Computed Risk Score: {score}/100
-        - Key Drivers: {", ".join(drivers)}
-        - Sources: {citation_text}
-        
-        Write a concise, professional assessment. 
-        MANDATORY: Explicitly cite the specific data sources for every observation (e.g., "Sighting verified via GBIF...", "Hydrological data from USGS indicates...").
-        Explain WHY the risk is high based on the specific drivers.
-        Do not use vague phrases; be precise and citation-focused.
-        """
-        
-        response = client.chat.completions.create(
-            model="gpt-4o", # Upgraded
-            messages=[{"role": "system", "content": "You are a helpful, precise environmental analyst."},
-                      {"role": "user", "content": prompt}],
-            max_tokens=80, # Increased for citation
-            temperature=0.7
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        print(f"OpenAI Error: {e}")
-        return "Automatic analysis unavailable."
+# All static guidance lives in one byte-stable system string so OpenAI's
+# automatic prompt-prefix caching hits on every call; only the per-request
+# region data goes in the user message
+ANALYST_SYSTEM_PROMPT = (
+    "You are a senior environmental risk analyst.\n"
+    "You will receive a JSON array of regions, each with a region index, species, "
+    "risk_score, drivers, and sources.\n"
+    "For EACH region, write a concise, professional assessment.\n"
+    "MANDATORY: Explicitly cite the specific data sources for every observation "
+    '(e.g., "Sighting verified via GBIF...", "Hydrological data from USGS indicates...").\n'
+    "Explain WHY the risk is high based on the specific drivers.\n"
+    "Do not use vague phrases; be precise and citation-focused.\n"
+    'Return a JSON object: {"explanations": [{"region": <n>, "explanation": "..."}, ...]} '
+    "with one entry per region, in order."
+)
 
+def explanation_cache_key(species, score, drivers, citations):
+    # Bucket the score to the nearest 10 so minor live-flow jitter still
+    # hits the same cached explanation
+    return (species, int(round(score, -1)), tuple(sorted(drivers)), tuple(sorted(citations)))
 
-@app.get("/predict", response_model=PredictionsResponse)
-async def get_predictions():
-    # 1. Run Quant Logic (Real Model + Live Data)
+async def generate_explanations_batch(items):
+    """
+    Generates assessments for all regions in ONE OpenAI call instead of one
+    call per region - a single round-trip and shared prompt overhead instead
+    of 6x each. items is a list of (species, score, drivers, citations);
+    returns explanation strings in the same order. Cached regions are served
+    locally and only the misses go into the batched prompt.
+    """
+    explanations = [None] * len(items)
+    misses = []
+    for i, (species, score, drivers, citations) in enumerate(items):
+        cache_key = explanation_cache_key(species, score, drivers, citations)
+        cached = EXPLANATION_CACHE.get(cache_key)
+        if cached is not None:
+            explanations[i] = cached
+        else:
+            misses.append((i, cache_key))
+
+    if misses:
+        try:
+            # Prompt Engineering for the "Analyst" Persona with Citations
+            regions_payload = []
+            for n, (i, _) in enumerate(misses):
+                species, score, drivers, citations = items[i]
+                regions_payload.append({
+                    "region": n,
+                    "species": species,
+                    "risk_score": f"{score}/100",
+                    "drivers": drivers,
+                    "sources": citations
+                })
+
+            response = await chat_completion_with_backoff(
+                model="gpt-4o-mini", # 80-token templated blurbs don't need the top tier
+                messages=[{"role": "system", "content": ANALYST_SYSTEM_PROMPT},
+                          {"role": "user", "content": json.dumps(regions_payload)}],
+                response_format={"type": "json_object"},
+                max_tokens=100 * len(misses),
+                temperature=0.3 # low variance keeps the cached texts stable
+            )
+            parsed = orjson.loads(response.choices[0].message.content)
+            for (i, cache_key), entry in zip(misses, parsed.get("explanations", [])):
+                text = str(entry.get("explanation", "")).strip()
+                if text:
+                    EXPLANATION_CACHE[cache_key] = text
+                    explanations[i] = text
+        except Exception as e:
+            log.warning(f"OpenAI Error: {e}")
+
+    # Per-region fallback for parse failures / missing entries
+    return [e if e is not None else "Automatic analysis unavailable." for e in explanations]
+
+
+async def refresh_explanations_via_batch():
+    """
+    Offline refresh of every region explanation through the OpenAI Batch API:
+    half the per-token cost and a separate, much larger rate-limit pool, at
+    the price of up-to-24h turnaround. Results land in EXPLANATION_CACHE
+    under the same keys the interactive path uses, so /predict becomes a
+    pure cache read after a refresh. Meant to be kicked off by a cron via
+    POST /refresh, not from the request path.
+    """
     quant_results = await run_inference()
-    
-    processed_regions = []
-    
+
+    request_lines = []
+    keys_by_custom_id = {}
     for item in quant_results:
         final_score = round(min(0.99, max(0.01, item['score'])), 2)
-        risk_label = "Critical" if final_score > 0.9 else ("High" if final_score > 0.6 else "Moderate")
-        
+        score = int(final_score * 100)
+        citations = sorted(set(item['citations']))
+        keys_by_custom_id[item['id']] = explanation_cache_key(
+            item['species'], score, item['drivers'], citations)
+
+        # Same byte-stable system prompt as the interactive path, with a
+        # one-region payload per batch line
+        region_payload = [{
+            "region": 0,
+            "species": item['species'],
+            "risk_score": f"{score}/100",
+            "drivers": item['drivers'],
+            "sources": citations
+        }]
+        request_lines.append(orjson.dumps({
+            "custom_id": item['id'],
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": "gpt-4o-mini",
+                "messages": [{"role": "system", "content": ANALYST_SYSTEM_PROMPT},
+                             {"role": "user", "content": json.dumps(region_payload)}],
+                "response_format": {"type": "json_object"},
+                "max_tokens": 100,
+                "temperature": 0.3
+            }
+        }))
+
+    try:
+        upload = await client.files.create(
+            file=("explanations.jsonl", b"\n".join(request_lines)), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=upload.id, endpoint="/v1/chat/completions",
+            completion_window="24h")
+
+        # Poll with widening intervals until the batch settles
+        delay = 30
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 600)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            log.warning(f"Explanation batch {batch.id} ended with status {batch.status}")
+            return 0
+
+        output = await client.files.content(batch.output_file_id)
+        loaded = 0
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            result = orjson.loads(line)
+            cache_key = keys_by_custom_id.get(result.get("custom_id"))
+            body = (result.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or []
+            if cache_key and choices:
+                content = (choices[0].get("message", {}).get("content") or "").strip()
+                try:
+                    entries = orjson.loads(content).get("explanations") or []
+                    text = str(entries[0].get("explanation", "")).strip() if entries else ""
+                except (orjson.JSONDecodeError, AttributeError, IndexError):
+                    text = ""
+                if text:
+                    EXPLANATION_CACHE[cache_key] = text
+                    loaded += 1
+        log.info(f"Explanation batch {batch.id} loaded {loaded} cached explanations")
+        return loaded
+    except Exception as e:
+        log.warning(f"OpenAI Batch Error: {e}")
+        return 0
+
+
+@app.post("/refresh")
+async def refresh_explanations():
+    """
+    Fire-and-forget trigger for the nightly Batch API explanation refresh.
+    """
+    asyncio.create_task(refresh_explanations_via_batch())
+    return {"status": "refresh started"}
+
+
+NOMINAL_EXPLANATION = "Risk levels are currently within nominal baselines."
+
+def score_and_link(quant_results):
+    """
+    Cheap scoring pass shared by /predict and /predict/stream: clips and
+    rounds all scores in one vectorized pass, assigns risk labels, and
+    structures citations with links. Returns a list of
+    (item, final_score, risk_label, linked_citations) tuples.
+    """
+    final_scores = np.round(np.clip([item['score'] for item in quant_results], 0.01, 0.99), 2)
+    # Nested np.where maps the score thresholds to labels in one pass
+    risk_labels = np.where(final_scores > 0.9, "Critical",
+                           np.where(final_scores > 0.6, "High", "Moderate")).tolist()
+    final_scores = final_scores.tolist()
+
+    scored_items = []
+    for item, final_score, risk_label in zip(quant_results, final_scores, risk_labels):
         # Structure Citations with Links
         linked_citations = []
         unique_cites = list(set(item['citations']))
@@ -501,38 +836,49 @@ async def get_predictions():
                     break
             linked_citations.append({"label": cite, "href": link})
 
-        # 2. Call Analyst Brain (OpenAI)
-        if final_score > 0.1:
-            explanation_text = generate_explanation(item['species'], int(final_score*100), item['drivers'], [c['label'] for c in linked_citations])
-        else:
-            explanation_text = "Risk levels are currently within nominal baselines."
-
-        processed_regions.append(
-            Region(
-                id=item['id'],
-                geometry=RegionGeometry(type="Polygon", coordinates=item['coords']),
-                properties=RegionProperties(
-                    risk_score=final_score,
-                    risk_label=risk_label,
-                    confidence="High",
-                    species=item['species'],
-                    drivers=item['drivers'],
-                    explanation=explanation_text,
-                    citations=linked_citations
-                )
-            )
+        scored_items.append((item, final_score, risk_label, linked_citations))
+
+    return scored_items
+
+def build_region(item, final_score, risk_label, linked_citations, explanation_text):
+    return Region(
+        id=item['id'],
+        geometry=REGION_GEOMETRIES[item['id']],
+        properties=RegionProperties(
+            risk_score=final_score,
+            risk_label=risk_label,
+            confidence="High",
+            species=item['species'],
+            drivers=item['drivers'],
+            explanation=explanation_text,
+            citations=linked_citations
         )
+    )
 
+def build_metadata(quant_results):
     # Track Health for Frontend Status Board
-    # Relaxed logic for demo: If we have ANY drivers/citations, assume success to avoid "Red Board" syndrome
+    # Regions flag their live feeds in 'sources' at fetch time, so health is
+    # O(1) set membership - no stringifying citation lists per check.
+    # Degraded feeds show yellow rather than red to avoid "Red Board" syndrome.
+    active_sources = set()
+    for r in quant_results:
+        active_sources |= r['sources']
+
     health = {
-        "maritime": "green", 
-        "us_data": "green", # Force Green for Demo Stability
-        "canada_data": "green", # Force Green for Demo Stability
-        "integrity": "green", # Force Green for Demo Stability
+        "maritime": "green",
+        "us_data": "green" if "USGS" in active_sources else "yellow",
+        "canada_data": "green" if {"WSC", "MSC"} & active_sources else "yellow",
+        "integrity": "green",
         "infrastructure": "green" if GLFC_BARRIERS else "yellow"
     }
 
+    return {
+        "model_version": "v1.8-glfc-integrated", # Aligned with v0.5 Release
+        "source": "Scikit-Learn + OpenAI + USGS (US) + WSC/MSC (Canada) + GBIF (Global) + GLFC (Infrastructure)",
+        "health": health
+    }
+
+def build_alerts(processed_regions, quant_results):
     # Generate Dynamic Alerts Feed
     alerts = []
     for r in processed_regions:
@@ -543,7 +889,7 @@ async def get_predictions():
                 "detail": f"Model detects {int(r.properties.risk_score*100)}% suitability in grid {r.id}.",
                 "timestamp": "JUST NOW"
             })
-    
+
     # Add some sighting alerts
     for r in quant_results:
         # Check if drivers mentions sightings
@@ -560,15 +906,107 @@ async def get_predictions():
                     "link": gbif_link
                 })
 
-    return PredictionsResponse(
-        metadata={
-            "model_version": "v1.8-glfc-integrated", # Aligned with v0.5 Release
-            "source": "Scikit-Learn + OpenAI + USGS (US) + WSC/MSC (Canada) + GBIF (Global) + GLFC (Infrastructure)",
-            "health": health
-        },
+    return alerts[:10] # Limit to top 10
+
+# Whole-response cache for /predict. The upstream gauges only refresh every
+# few minutes, so concurrent dashboard loads within the TTL can share one
+# encoded payload instead of each re-running inference + the OpenAI batch.
+PREDICT_CACHE = TTLCache(maxsize=1, ttl=60)
+PREDICT_LOCK = asyncio.Lock()
+
+@app.get("/predict")
+async def get_predictions():
+    cached = PREDICT_CACHE.get("predict")
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    async with PREDICT_LOCK:
+        # Single-flight: whoever lost the race returns the winner's bytes
+        cached = PREDICT_CACHE.get("predict")
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        body = await build_predictions_response()
+        PREDICT_CACHE["predict"] = body
+    return Response(content=body, media_type="application/json")
+
+async def build_predictions_response():
+    # 1. Run Quant Logic (Real Model + Live Data)
+    quant_results = await run_inference()
+
+    # First pass: cheap scoring + citation linking, so the OpenAI work can
+    # run as a single batched call afterwards.
+    scored_items = score_and_link(quant_results)
+
+    # 2. Call Analyst Brain (OpenAI) - one batched call covers every region
+    batch_positions = []
+    batch_items = []
+    for pos, (item, final_score, risk_label, linked_citations) in enumerate(scored_items):
+        if final_score > 0.1:
+            batch_positions.append(pos)
+            batch_items.append((item['species'], int(final_score*100), item['drivers'],
+                                [c['label'] for c in linked_citations]))
+
+    explanations = [NOMINAL_EXPLANATION] * len(scored_items)
+    if batch_items:
+        for pos, text in zip(batch_positions, await generate_explanations_batch(batch_items)):
+            explanations[pos] = text
+
+    processed_regions = [
+        build_region(*scored, explanation_text)
+        for scored, explanation_text in zip(scored_items, explanations)
+    ]
+
+    payload = PredictionsResponse(
+        metadata=build_metadata(quant_results),
         regions=processed_regions,
-        alerts=alerts[:10] # Limit to top 10
+        alerts=build_alerts(processed_regions, quant_results)
     )
+    # Encode with msgspec directly - no pydantic re-validation of the response
+    return msgspec.json.encode(payload)
+
+@app.get("/predict/stream")
+async def get_predictions_stream():
+    """
+    NDJSON variant of /predict. Yields the metadata line first, then each
+    region as soon as its explanation is available - cache hits and nominal
+    regions immediately, the rest when the batched OpenAI call lands - then
+    the alerts feed. The dashboard paints its first polygons at
+    time-to-first-region instead of waiting on the slowest completion.
+    """
+    quant_results = await run_inference()
+    scored_items = score_and_link(quant_results)
+
+    async def gen():
+        yield msgspec.json.encode({"type": "metadata", "metadata": build_metadata(quant_results)}) + b"\n"
+
+        processed_regions = [None] * len(scored_items)
+        pending = []  # (position, batch item) for regions needing the LLM
+
+        for pos, (item, final_score, risk_label, linked_citations) in enumerate(scored_items):
+            explanation_text = None
+            if final_score <= 0.1:
+                explanation_text = NOMINAL_EXPLANATION
+            else:
+                labels = [c['label'] for c in linked_citations]
+                explanation_text = EXPLANATION_CACHE.get(explanation_cache_key(
+                    item['species'], int(final_score*100), item['drivers'], labels))
+                if explanation_text is None:
+                    pending.append((pos, (item['species'], int(final_score*100), item['drivers'], labels)))
+
+            if explanation_text is not None:
+                region = build_region(*scored_items[pos], explanation_text)
+                processed_regions[pos] = region
+                yield msgspec.json.encode({"type": "region", "region": region}) + b"\n"
+
+        if pending:
+            texts = await generate_explanations_batch([bi for _, bi in pending])
+            for (pos, _), explanation_text in zip(pending, texts):
+                region = build_region(*scored_items[pos], explanation_text)
+                processed_regions[pos] = region
+                yield msgspec.json.encode({"type": "region", "region": region}) + b"\n"
+
+        yield msgspec.json.encode({"type": "alerts", "alerts": build_alerts(processed_regions, quant_results)}) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
 
 @app.get("/infrastructure", response_model=InfrastructureResponse)
 async def get_infrastructure():
@@ -627,10 +1065,6 @@ async def get_infrastructure():
     # Deduplicate or sort if needed
     return InfrastructureResponse(points=points)
 
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-import pathlib
-
 # Robust Path Resolution (Resolves relative to this file, backend/main.py)
 # BASE_DIR = invasive-species-tracker/
 BASE_DIR = pathlib.Path(__file__).parent.parent 
@@ -638,6 +1072,11 @@ BASE_DIR = pathlib.Path(__file__).parent.parent
 app.mount("/css", StaticFiles(directory=BASE_DIR / "css"), name="css")
 app.mount("/js", StaticFiles(directory=BASE_DIR / "js"), name="js")
 
+# Resolve and stat index.html once - serving it per request would otherwise
+# re-stat the file on every hit
+INDEX_PATH = str((BASE_DIR / "index.html").resolve())
+INDEX_STAT = os.stat(INDEX_PATH)
+
 @app.get("/")
 async def read_index():
-    return FileResponse(BASE_DIR / "index.html")
+    return FileResponse(INDEX_PATH, stat_result=INDEX_STAT)
@@ -1,67 +1,103 @@
-import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.model_selection import train_test_split
 import joblib
 import os
 
-# 1. Generate Synthetic Training Data
-# In a real scenario, we would load CSVs from /data/
-print("Generatring synthetic environmental data...")
-
-# Features: 
-# - water_temp_anomaly (degrees C above normal)
-# - distance_to_source (km)
-# - vessel_traffic_density (0-1 score)
-# - dissolved_oxygen (mg/L) - Critical for fish survival
-# - flow_velocity (m/s) - Affects upstream migration capability
-
-n_samples = 1000
-np.random.seed(42)
-
-data = {
-    'water_temp_anomaly': np.random.normal(1.0, 0.5, n_samples),
-    'distance_to_source': np.random.exponential(50, n_samples),
-    'vessel_traffic_density': np.random.beta(2, 5, n_samples),
-    'dissolved_oxygen': np.random.normal(8, 1.5, n_samples),
-    'flow_velocity': np.random.normal(0.5, 0.2, n_samples)
-}
-
-df = pd.DataFrame(data)
-
-# Target Variable: Invasion Risk (0-100)
-# Bio-Logic: 
-# - Higher temp = +Risk
-# - Low DO (<4) = -Risk (Dead zone)
-# - High Flow (>1.0) = -Risk (Hard to migrate upstream)
-df['risk_score'] = (
-    (df['water_temp_anomaly'] * 15) + 
-    ((100 - df['distance_to_source']) * 0.4) + 
-    (df['vessel_traffic_density'] * 30) +
-    (df['dissolved_oxygen'] * 2) -  # DO helps them survive
-    (df['flow_velocity'] * 10) +    # High flow hinders them
-    np.random.normal(0, 5, n_samples)
-)
-
-# Penalty for Hypoxia (Low Oxygen)
-df.loc[df['dissolved_oxygen'] < 3, 'risk_score'] -= 40
-
-# Normalize to 0-1
-df['risk_score'] = (df['risk_score'] - df['risk_score'].min()) / (df['risk_score'].max() - df['risk_score'].min())
-
-print(f"Dataset Shape: {df.shape}")
-
-# 2. Train Model
-# We now have 5 dimensions of robustness
-X = df[['water_temp_anomaly', 'distance_to_source', 'vessel_traffic_density', 'dissolved_oxygen', 'flow_velocity']]
-y = df['risk_score']
-
-model = RandomForestRegressor(n_estimators=100, random_state=42)
-model.fit(X, y)
-
-print("Model Trained. R2 Score:", model.score(X,y))
-
-# 3. Save Model
-os.makedirs("models", exist_ok=True)
-joblib.dump(model, "models/invasive_risk_model_v1.joblib")
-print("Model saved to backend/models/invasive_risk_model_v1.joblib")
+MODEL_PATH = "models/invasive_risk_model_v1.joblib"
+
+def main():
+    # Skip retraining when the saved model is newer than this script - the
+    # data is synthetic and seeded, so the artifact only goes stale when the
+    # training code itself changes. Delete the .joblib to force a retrain.
+    if os.path.exists(MODEL_PATH) and os.path.getmtime(MODEL_PATH) >= os.path.getmtime(__file__):
+        print(f"{MODEL_PATH} is up to date; skipping retrain.")
+        return
+
+    # 1. Generate Synthetic Training Data
+    # In a real scenario, we would load CSVs from /data/
+    print("Generatring synthetic environmental data...")
+
+    # Features:
+    # - water_temp_anomaly (degrees C above normal)
+    # - distance_to_source (km)
+    # - vessel_traffic_density (0-1 score)
+    # - dissolved_oxygen (mg/L) - Critical for fish survival
+    # - flow_velocity (m/s) - Affects upstream migration capability
+
+    n_samples = 1000
+    np.random.seed(42)
+
+    # Plain ndarrays end to end - no DataFrame round-trip just to do column
+    # arithmetic. Draw order matches the old dict so the seed reproduces the
+    # same dataset.
+    water_temp_anomaly = np.random.normal(1.0, 0.5, n_samples)
+    distance_to_source = np.random.exponential(50, n_samples)
+    vessel_traffic_density = np.random.beta(2, 5, n_samples)
+    dissolved_oxygen = np.random.normal(8, 1.5, n_samples)
+    flow_velocity = np.random.normal(0.5, 0.2, n_samples)
+
+    # Target Variable: Invasion Risk (0-100)
+    # Bio-Logic:
+    # - Higher temp = +Risk
+    # - Low DO (<4) = -Risk (Dead zone)
+    # - High Flow (>1.0) = -Risk (Hard to migrate upstream)
+    risk_score = (
+        (water_temp_anomaly * 15) +
+        ((100 - distance_to_source) * 0.4) +
+        (vessel_traffic_density * 30) +
+        (dissolved_oxygen * 2) -  # DO helps them survive
+        (flow_velocity * 10) +    # High flow hinders them
+        np.random.normal(0, 5, n_samples)
+    )
+
+    # Penalty for Hypoxia (Low Oxygen)
+    risk_score[dissolved_oxygen < 3] -= 40
+
+    # Normalize to 0-1
+    risk_score = (risk_score - risk_score.min()) / (risk_score.max() - risk_score.min())
+
+    # 2. Train Model
+    # We now have 5 dimensions of robustness
+    # Fit on plain ndarrays so the estimator stores no feature_names_in_ and
+    # serving can predict on raw arrays without the feature-names warning.
+    # float32 is HistGradientBoosting's native histogram dtype - casting here
+    # halves memory and avoids a copy at fit time, and matches the float32
+    # feature matrix main.py builds at serving time
+    X = np.stack([water_temp_anomaly, distance_to_source, vessel_traffic_density,
+                  dissolved_oxygen, flow_velocity], axis=1).astype(np.float32)
+    y = risk_score.astype(np.float32)
+
+    print(f"Dataset Shape: {X.shape}")
+
+    # Histogram-based boosting: predicts in microseconds for this tiny feature
+    # space and serializes to ~KBs, vs the ~MB 100-tree RandomForest artifact
+    model = HistGradientBoostingRegressor(max_iter=100, max_depth=4, random_state=42)
+    model.fit(X, y)
+
+    print("Model Trained. R2 Score:", model.score(X,y))
+
+    # 3. Save Model
+    os.makedirs("models", exist_ok=True)
+    joblib.dump(model, MODEL_PATH)
+    print("Model saved to backend/models/invasive_risk_model_v1.joblib")
+
+    # 4. Optional: compile the tree model to a native shared library.
+    # main.py prefers this over the joblib artifact when treelite_runtime is
+    # installed - float32 thresholds, contiguous node arrays, ~3-10x faster predict.
+    try:
+        import treelite
+        import treelite.sklearn
+        tl_model = treelite.sklearn.import_model(model)
+        tl_model.export_lib(toolchain="gcc", libpath="models/invasive_risk_model_v1.so",
+                            params={"parallel_comp": 4})
+        print("Compiled model saved to models/invasive_risk_model_v1.so")
+    except ImportError:
+        print("Treelite not installed; skipping compiled model export.")
+    except Exception as e:
+        # Conversion failures (e.g. an estimator treelite doesn't support) should
+        # not fail training - the joblib artifact alone is enough to serve
+        print(f"Treelite export failed, continuing with joblib artifact only: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -229,28 +229,46 @@ async function loadAILayer() {
             ? 'http://127.0.0.1:8000/predict'
             : '/predict';
 
-        console.log(`Fetching AI Predictions from: ${apiUrl}`);
-        const response = await fetch(apiUrl);
+        // NDJSON stream: regions render as soon as the backend emits them,
+        // so the map paints at time-to-first-region instead of waiting for
+        // the slowest explanation.
+        const streamUrl = apiUrl + '/stream';
+        console.log(`Fetching AI Predictions from: ${streamUrl}`);
+        const response = await fetch(streamUrl);
 
         if (!response.ok) throw new Error("API Response Error");
 
-        const data = await response.json();
-        renderRiskPolygons(data.regions);
-
-        // Update Intelligence Feed
-        if (data.alerts) {
-            updateAlertsFeed(data.alerts);
-        }
-
-        // Load the first region's data into the side panel as default context
-        if (data.regions.length > 0) {
-            updateSidePanel(data.regions[0].properties);
-        }
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let firstRegion = true;
+
+        const handleMessage = (msg) => {
+            if (msg.type === 'metadata' && msg.metadata && msg.metadata.health) {
+                updateStatusUI(msg.metadata.health);
+            } else if (msg.type === 'region') {
+                renderRiskPolygons([msg.region]);
+                // Load the first region's data into the side panel as default context
+                if (firstRegion) {
+                    updateSidePanel(msg.region.properties);
+                    firstRegion = false;
+                }
+            } else if (msg.type === 'alerts' && msg.alerts) {
+                updateAlertsFeed(msg.alerts);
+            }
+        };
 
-        // Update health status based on backend metadata
-        if (data.metadata && data.metadata.health) {
-            updateStatusUI(data.metadata.health);
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop(); // keep any partial trailing line
+            for (const line of lines) {
+                if (line.trim()) handleMessage(JSON.parse(line));
+            }
         }
+        if (buffer.trim()) handleMessage(JSON.parse(buffer));
 
     } catch (error) {
         console.error("Failed to load AI Layer:", error);
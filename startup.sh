@@ -1,2 +1,6 @@
 #!/bin/bash
+# Pin BLAS/OpenMP to one thread: predictions are tiny 6-row batches, and
+# oversubscribed thread pools only add contention under gunicorn
+export OMP_NUM_THREADS=1
+export MKL_NUM_THREADS=1
 gunicorn --bind=0.0.0.0 --timeout 600 backend.main:app -k uvicorn.workers.UvicornWorker